@@ -20,33 +20,74 @@ Run 'python3 applecal.py --help' for full usage.
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.util
+import io
 import json
 import logging
-import mimetypes
+import operator
 import os
 import re
-import subprocess
 import sys
+import threading
+import time
 import uuid
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import quote, urljoin, urlparse
 
+# Optional: lxml (libxml2) parses large multistatus replies much faster than
+# the stdlib ElementTree. Entity resolution and network access stay disabled.
 try:
-    import requests
-    from requests.auth import HTTPBasicAuth
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
+    from lxml import etree as LET  # type: ignore
+    _USE_LXML = True
 except ImportError:
+    LET = None
+    _USE_LXML = False
+
+# Optional: orjson serializes large event lists several times faster than json.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Optional: httpx with HTTP/2 (needs the h2 package) multiplexes concurrent
+# CalDAV requests over one TLS connection instead of one per request; requests
+# is the fallback. Only availability is checked here: AppleCalClient imports the
+# chosen backend, so --version/--help never load an HTTP stack.
+_USE_HTTP2 = importlib.util.find_spec("httpx") is not None and importlib.util.find_spec("h2") is not None
+if not _USE_HTTP2 and importlib.util.find_spec("requests") is None:
     print(json.dumps({"error": "Missing dependency: requests. Run 'pip3 install requests'"}))
     sys.exit(1)
 
+_XML_PARSE_ERRORS = (ET.ParseError, LET.XMLSyntaxError) if _USE_LXML else (ET.ParseError,)
+
 __version__ = "1.1.1"
 PRODID = "-//OpenClaw//AppleCalPro 1.1.1//EN"
+ICS_HEADER = f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{PRODID}\r\nBEGIN:VEVENT\r\n"
+ICS_FOOTER = "END:VEVENT\r\nEND:VCALENDAR\r\n"
 UID_SAFE_RE = re.compile(r"^[A-Za-z0-9._@:+-]{1,255}$")
 MANAGED_ID_SAFE_RE = re.compile(r"^[A-Za-z0-9._:+-]{1,255}$")
+MANAGED_ID_RE = re.compile(r"MANAGED-ID=([^:;]+)")
+YYYYMMDD_RE = re.compile(r"\d{8}")
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+NON_DIGIT_T_RE = re.compile(r"[^0-9T]")
+NON_DIGIT_RE = re.compile(r"[^0-9]")
+ICAL_UNESCAPE_RE = re.compile(r"\\([\\;,])")
+ICAL_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+ICS_UNFOLD_RE = re.compile(r"\r?\n[ \t]")
+# A whole (possibly folded) property line, continuation lines included.
+ICS_ATTACH_RE = re.compile(r"(?m)^ATTACH[^\r\n]*(?:\r?\n[ \t][^\r\n]*)*")
+ICS_FREEBUSY_RE = re.compile(r"(?m)^FREEBUSY[^\r\n]*(?:\r?\n[ \t][^\r\n]*)*")
+# One start/end period of a comma-separated FREEBUSY value; malformed periods never match.
+FB_INTERVAL_RE = re.compile(r"(?:^|,)\s*([^,/\s]+)\s*/\s*([^,/\s]+)\s*(?=,|$)")
+# RFC 5545 dur-value, e.g. PT1H30M, P1D, P2W (a period may end in one instead of a time)
+ICAL_DURATION_RE = re.compile(r"([+-]?)P(?:(\d+)W|(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?)")
+ICAL_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,"})
 
 ALLOWED_ATTACHMENT_EXTENSIONS = {
     ".pdf", ".txt", ".md", ".csv", ".tsv", ".json",
@@ -61,7 +102,7 @@ SENSITIVE_DIR_SEGMENTS = {
     ".ssh", ".gnupg", ".aws", ".azure", ".kube", ".config", "keychains",
 }
 
-SENSITIVE_NAME_PATTERNS = [
+SENSITIVE_NAME_PATTERNS = [re.compile(p) for p in (
     r"^\.env($|\.)",
     r"(^|[_\-.])credentials?([_\-.]|$)",
     r"(^|[_\-.])secret(s)?([_\-.]|$)",
@@ -69,7 +110,7 @@ SENSITIVE_NAME_PATTERNS = [
     r"(^|[_\-.])keychain([_\-.]|$)",
     r"^id_(rsa|ed25519|ecdsa)(\.pub)?$",
     r"\.(pem|key|p12|pfx|p8)$",
-]
+)]
 
 # --- Logging ---
 logger = logging.getLogger("applecal")
@@ -78,6 +119,15 @@ logger = logging.getLogger("applecal")
 ICLOUD_WELL_KNOWN = "https://caldav.icloud.com/.well-known/caldav"
 DEFAULT_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+RETRY_METHODS = ("GET", "HEAD", "OPTIONS", "PROPFIND", "REPORT")
+MAX_PARALLEL_REQUESTS = 8  # per-calendar REPORTs issued concurrently
+HTTP_POOL_SIZE = 16
+STREAM_MIN_BYTES = 64 * 1024  # smaller bodies are buffered; streaming isn't worth it
+EVENTS_CACHE_SCHEMA = 1  # bump whenever the shape of parse_ics_event output changes
+EVENTS_CACHE_MAX_PER_CALENDAR = 8  # most recently used time ranges kept per calendar
+EVENTS_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds; older entries are deleted on write
 
 NS = {
     "d": "DAV:",
@@ -86,9 +136,61 @@ NS = {
     "apple": "http://apple.com/ns/ical/",
 }
 
-# Register namespaces for ET
-for prefix, uri in NS.items():
-    ET.register_namespace(prefix, uri)
+# --- CalDAV request bodies ---
+PRINCIPAL_PROPFIND = '<?xml version="1.0"?><d:propfind xmlns:d="DAV:"><d:prop><d:current-user-principal/></d:prop></d:propfind>'
+
+HOME_PROPFIND = '''<?xml version="1.0"?>
+<d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+    <d:prop>
+        <c:calendar-home-set/>
+        <c:schedule-outbox-URL/>
+        <c:calendar-user-address-set/>
+    </d:prop>
+</d:propfind>'''
+
+CALENDARS_PROPFIND = '<?xml version="1.0"?><d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav"><d:prop><d:displayname/><c:supported-calendar-component-set/></d:prop></d:propfind>'
+
+# Filled in with str.format; interpolated values must be XML-safe.
+CALENDAR_QUERY_TIME_RANGE = '''<?xml version="1.0" encoding="utf-8" ?>
+<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+    <d:prop>
+        <d:getetag />
+        <c:calendar-data />
+    </d:prop>
+    <c:filter>
+        <c:comp-filter name="VCALENDAR">
+            <c:comp-filter name="VEVENT">
+                <c:time-range start="{start}" end="{end}"/>
+            </c:comp-filter>
+        </c:comp-filter>
+    </c:filter>
+</c:calendar-query>'''
+
+CALENDAR_QUERY_UID = '''<?xml version="1.0" encoding="utf-8" ?>
+<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+    <d:prop><d:getetag /><c:calendar-data /></d:prop>
+    <c:filter>
+        <c:comp-filter name="VCALENDAR">
+            <c:comp-filter name="VEVENT">
+                <c:prop-filter name="UID">
+                    <c:text-match collation="i;octet">{uid}</c:text-match>
+                </c:prop-filter>
+            </c:comp-filter>
+        </c:comp-filter>
+    </c:filter>
+</c:calendar-query>'''
+
+CTAG_PROPFIND = '<?xml version="1.0"?><d:propfind xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/"><d:prop><cs:getctag/></d:prop></d:propfind>'
+
+FREE_BUSY_QUERY = '''<?xml version="1.0" encoding="utf-8" ?>
+<c:free-busy-query xmlns:c="urn:ietf:params:xml:ns:caldav">
+    <c:time-range start="{start}" end="{end}"/>
+</c:free-busy-query>'''
+
+# Register namespaces for ET (lxml takes nsmap at element creation instead)
+if not _USE_LXML:
+    for prefix, uri in NS.items():
+        ET.register_namespace(prefix, uri)
 
 # --- Utility Functions ---
 
@@ -99,8 +201,40 @@ class JSONArgumentParser(argparse.ArgumentParser):
         raise ValueError(message)
 
 
+class _JSONError(RuntimeError):
+    """RuntimeError whose payload is emitted as the CLI's JSON error output."""
+
+    def __init__(self, payload: dict):
+        super().__init__(payload.get("error", ""))
+        self.payload = payload
+
+
+def _dumps(obj, indent: Optional[int] = None) -> bytes:
+    """Serialize CLI output with sorted keys, as UTF-8 bytes.
+
+    orjson only supports a 2-space indent, so other --json-indent widths use json.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=indent, sort_keys=True).encode("utf-8")
+
+
+def _emit_json(obj, indent: Optional[int] = None) -> None:
+    """Write CLI output to stdout's byte buffer, skipping the str round-trip."""
+    data = _dumps(obj, indent=indent)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. redirected to StringIO)
+        print(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data + b"\n")
+    buffer.flush()
+
+
 def _json_error(message: str, indent: Optional[int] = None) -> None:
-    print(json.dumps({"error": message}, indent=indent, sort_keys=True))
+    _emit_json({"error": message}, indent=indent)
 
 
 def require_non_empty(value: Optional[str], field_name: str) -> str:
@@ -112,6 +246,21 @@ def require_non_empty(value: Optional[str], field_name: str) -> str:
     return clean
 
 
+def unique_calendar_names(names):
+    """Drop repeated calendar names, case-insensitively like get_calendar_url.
+
+    The first spelling of each name wins and the input order is kept.
+    """
+    seen = set()
+    unique = []
+    for name in names:
+        key = name.lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(name)
+    return unique
+
+
 def validate_uid(uid: str) -> str:
     clean = require_non_empty(uid, "uid")
     if not UID_SAFE_RE.fullmatch(clean):
@@ -128,8 +277,8 @@ def validate_managed_id(managed_id: str) -> str:
 
 def validate_time_range(start_value: str, end_value: str, *, all_day: bool = False) -> None:
     if all_day:
-        start_date = datetime.strptime(iso_to_caldav_date(start_value), "%Y%m%d")
-        end_date = datetime.strptime(iso_to_caldav_date(end_value), "%Y%m%d")
+        start_date = _parse_caldav_date(iso_to_caldav_date(start_value))
+        end_date = _parse_caldav_date(iso_to_caldav_date(end_value))
     else:
         start_date = parse_iso_datetime(start_value)
         end_date = parse_iso_datetime(end_value)
@@ -146,42 +295,46 @@ def validate_time_range(start_value: str, end_value: str, *, all_day: bool = Fal
 def escape_ical_text(value: Optional[str]) -> str:
     if value is None:
         return ""
-    escaped = value.replace("\\", "\\\\")
-    escaped = escaped.replace("\r\n", "\\n").replace("\n", "\\n").replace("\r", "\\n")
-    escaped = escaped.replace(";", "\\;").replace(",", "\\,")
-    return escaped
+    # Escape backslashes before newlines become "\n", or those would be doubled too.
+    return ICAL_NEWLINE_RE.sub(r"\\n", value.translate(ICAL_ESCAPE_TABLE))
 
 
 def unescape_ical_text(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
-    return re.sub(r"\\([\\;,])", r"\1", value.replace("\\n", "\n").replace("\\N", "\n"))
+    return ICAL_UNESCAPE_RE.sub(r"\1", value.replace("\\n", "\n").replace("\\N", "\n"))
 
 
 def fold_ical_line(line: str, limit: int = 75) -> list[str]:
-    if len(line.encode("utf-8")) <= limit:
+    if line.isascii():
+        # One byte per character: fold by slicing the str, no encode/decode.
+        if len(line) <= limit:
+            return [line]
+        return [line[:limit]] + [f" {line[i:i + limit]}" for i in range(limit, len(line), limit)]
+
+    data = line.encode("utf-8")
+    size = len(data)
+    if size <= limit:
         return [line]
 
-    chunks = []
-    current_chars = []
-    current_len = 0
-
-    for ch in line:
-        ch_len = len(ch.encode("utf-8"))
-        if current_chars and current_len + ch_len > limit:
-            chunks.append("".join(current_chars))
-            current_chars = [ch]
-            current_len = ch_len
+    # Cut on UTF-8 codepoint boundaries: continuation bytes look like 0b10xxxxxx.
+    folded = []
+    pos = 0
+    while pos < size:
+        cut = pos + limit
+        if cut >= size:
+            cut = size
         else:
-            current_chars.append(ch)
-            current_len += ch_len
-
-    if current_chars:
-        chunks.append("".join(current_chars))
-
-    folded = [chunks[0]]
-    for chunk in chunks[1:]:
-        folded.append(f" {chunk}")
+            while cut > pos and (data[cut] & 0xC0) == 0x80:
+                cut -= 1
+            if cut == pos:
+                # A single codepoint wider than the limit goes on its own line.
+                cut = pos + 1
+                while cut < size and (data[cut] & 0xC0) == 0x80:
+                    cut += 1
+        chunk = data[pos:cut].decode("utf-8")
+        folded.append(f" {chunk}" if folded else chunk)
+        pos = cut
     return folded
 
 
@@ -192,6 +345,24 @@ def build_ical_text(lines: list[str]) -> str:
     return "\r\n".join(folded) + "\r\n"
 
 
+# (epoch second, formatted stamp); one tuple so threads never see a torn pair
+_last_dtstamp = (-1, "")
+
+
+def _dtstamp_now() -> str:
+    """Current UTC time as an iCalendar DTSTAMP (YYYYMMDDTHHMMSSZ).
+
+    The stamp only changes once per second, so batch writes reuse it.
+    """
+    global _last_dtstamp
+    now = int(time.time())
+    second, stamp = _last_dtstamp
+    if now != second:
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(now))
+        _last_dtstamp = (now, stamp)
+    return stamp
+
+
 def build_content_disposition_filename(filename: str) -> str:
     """Build a safe Content-Disposition value supporting non-ASCII filenames."""
     clean = filename.replace("\r", "_").replace("\n", "_").replace('"', "'").strip() or "attachment"
@@ -220,7 +391,7 @@ def resolve_attachment_path(file_path: str) -> Path:
         raise ValueError("Blocked sensitive file path")
 
     name = path.name.lower()
-    if any(re.search(pattern, name) for pattern in SENSITIVE_NAME_PATTERNS):
+    if any(pattern.search(name) for pattern in SENSITIVE_NAME_PATTERNS):
         raise ValueError("Blocked sensitive file name")
 
     safe_root_raw = os.environ.get("APPLECAL_ATTACH_DIR", "").strip()
@@ -276,15 +447,16 @@ def get_keychain_password(server: str, account: str) -> str:
             "Generate an app-specific password at: https://appleid.apple.com"
         )
 
+    import subprocess
+
     try:
-        result = subprocess.run(
+        output = subprocess.check_output(
             ["security", "find-internet-password", "-s", server, "-a", account, "-w"],
-            capture_output=True, text=True, timeout=10
+            stderr=subprocess.DEVNULL, timeout=10
         )
     except subprocess.TimeoutExpired as exc:
         raise RuntimeError("Timed out while reading password from macOS Keychain") from exc
-
-    if result.returncode != 0:
+    except subprocess.CalledProcessError as exc:
         raise RuntimeError(
             f"Keychain entry not found for {account}@{server}.\n"
             f"Option 1 — Environment variable (cross-platform):\n"
@@ -292,16 +464,96 @@ def get_keychain_password(server: str, account: str) -> str:
             f"Option 2 — macOS Keychain:\n"
             f"  security add-internet-password -s '{server}' -a '{account}' -w 'YOUR_APP_SPECIFIC_PASSWORD'\n"
             f"Generate an app-specific password at: https://appleid.apple.com"
-        )
+        ) from exc
     logger.debug("Auth: using macOS Keychain")
-    return result.stdout.strip()
+    return output.decode("utf-8").strip()
+
+def _lxml_parser():
+    return LET.XMLParser(huge_tree=False, resolve_entities=False, no_network=True)
 
 def parse_xml(text):
+    if _USE_LXML:
+        data = text.encode("utf-8") if isinstance(text, str) else text
+        try:
+            return LET.fromstring(data, parser=_lxml_parser())
+        except LET.XMLSyntaxError as e:
+            raise ValueError(f"Invalid XML response from CalDAV server: {e}") from e
     try:
         return ET.fromstring(text)
     except ET.ParseError as e:
         raise ValueError(f"Invalid XML response from CalDAV server: {e}") from e
 
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (httpx streams)."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+def _response_body_source(resp):
+    """File-like view of a response body, read straight off the socket when large."""
+    length = resp.headers.get("Content-Length")
+    small = length is not None and length.isdigit() and int(length) < STREAM_MIN_BYTES
+    if not hasattr(resp, "raw"):
+        # httpx response
+        if small:
+            return io.BytesIO(resp.read())
+        return _ChunkReader(resp.iter_bytes())
+    if small:
+        return io.BytesIO(resp.content)
+    resp.raw.decode_content = True
+    return resp.raw
+
+def _raise_for_status(resp) -> None:
+    """resp.raise_for_status(), closing the response first so an error never
+    leaks a pooled connection (or an HTTP/2 stream) held by a streamed reply."""
+    try:
+        resp.raise_for_status()
+    except Exception:
+        resp.close()
+        raise
+
+def _iter_multistatus_responses(resp) -> Iterator:
+    """Yield each {DAV:}response element of a multistatus body as it is parsed.
+
+    Elements are cleared once the consumer moves on, so only one response is
+    held in memory at a time. Callers must extract what they need before
+    advancing the iterator. Works best on responses requested with stream=True.
+    """
+    try:
+        source = _response_body_source(resp)
+        if _USE_LXML:
+            context = LET.iterparse(source, events=("end",), tag="{DAV:}response",
+                                    huge_tree=False, resolve_entities=False, no_network=True)
+            for _, elem in context:
+                yield elem
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        else:
+            for _, elem in ET.iterparse(source, events=("end",)):
+                if elem.tag == "{DAV:}response":
+                    yield elem
+                    elem.clear()
+    except _XML_PARSE_ERRORS as e:
+        raise ValueError(f"Invalid XML response from CalDAV server: {e}") from e
+    finally:
+        resp.close()
+
 def get_href(element):
     if element is None:
         return None
@@ -317,21 +569,44 @@ def iso_to_caldav(iso_str):
         raise ValueError(f"Invalid datetime format: {iso_str}")
     return dt.strftime("%Y%m%dT%H%M%SZ")
 
+def _parse_caldav_date(value, tzinfo=None):
+    """YYYYMMDD -> datetime by slicing; strptime is far slower for a fixed layout."""
+    return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]), tzinfo=tzinfo)
+
+def _parse_caldav_datetime(value):
+    """YYYYMMDDTHHMMSS (digits and T only) -> UTC datetime by slicing."""
+    return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                    int(value[9:11]), int(value[11:13]), int(value[13:15]), tzinfo=timezone.utc)
+
 def caldav_to_iso(cal_str):
     """Convert CalDAV UTC format YYYYMMDDTHHMMSSZ to ISO 8601."""
     if not cal_str: return None
-    clean = re.sub(r'[^0-9T]', '', cal_str)
+    clean = NON_DIGIT_T_RE.sub("", cal_str)
+    if len(clean) == 15 and clean[8] == "T":
+        try:
+            return _parse_caldav_datetime(clean).isoformat()
+        except ValueError:
+            pass
     try:
         dt = datetime.strptime(clean, "%Y%m%dT%H%M%S")
         return dt.replace(tzinfo=timezone.utc).isoformat()
     except Exception:
         return cal_str
 
+def parse_ical_duration(value) -> Optional[timedelta]:
+    """Parse an RFC 5545 duration (e.g. PT1H); returns None if value is not one."""
+    match = ICAL_DURATION_RE.fullmatch(value or "")
+    if not match or not any(match.groups()[1:]):
+        return None
+    weeks, days, hours, minutes, seconds = (int(g or 0) for g in match.groups()[1:])
+    duration = timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return -duration if match.group(1) == "-" else duration
+
 def parse_iso_datetime(value):
     """Robust ISO 8601 parser with UTC normalization."""
     if not value: return None
-    if re.fullmatch(r"\d{8}", value):
-        return datetime.strptime(value, "%Y%m%d").replace(tzinfo=timezone.utc)
+    if YYYYMMDD_RE.fullmatch(value):
+        return _parse_caldav_date(value, timezone.utc)
     # Handle Z and offset
     clean = value.replace('Z', '+00:00')
     try:
@@ -342,102 +617,153 @@ def parse_iso_datetime(value):
     except Exception:
         return None
 
-def clip_to_range(start_dt, end_dt, query_start, query_end):
-    """Clip a time range to within query bounds. Returns None if no overlap."""
-    clipped_start = max(start_dt, query_start)
-    clipped_end = min(end_dt, query_end)
-    if clipped_start >= clipped_end:
-        return None
-    return {"start": clipped_start.isoformat(), "end": clipped_end.isoformat()}
+def _merge_intervals(sorted_busy):
+    """Merge overlapping or touching busy intervals in a single sweep.
+
+    Each merged interval keeps the calendars it was built from. Entries whose
+    times cannot be parsed are passed through unmerged at the end of the list,
+    so a busy period is never lost from the result.
+    """
+    parsed = []
+    unparsed = []
+    for b in sorted_busy:
+        start, end = parse_iso_datetime(b["start"]), parse_iso_datetime(b["end"])
+        if start is not None and end is not None:
+            parsed.append((start, end, b))
+        else:
+            unparsed.append({"start": b["start"], "end": b["end"], "calendars": [b["calendar"]]})
+    # Input is already ordered by its ISO strings; re-sorting on the parsed
+    # values only matters for mixed offsets and is near-linear otherwise.
+    parsed.sort(key=operator.itemgetter(0, 1))
+
+    merged = []
+    cur = cur_end = None
+    for start, end, b in parsed:
+        if cur is not None and start <= cur_end:
+            if end > cur_end:
+                cur_end = end
+                cur["end"] = b["end"]
+            if b["calendar"] not in cur["calendars"]:
+                cur["calendars"].append(b["calendar"])
+        else:
+            cur = {"start": b["start"], "end": b["end"], "calendars": [b["calendar"]]}
+            cur_end = end
+            merged.append(cur)
+    merged.extend(unparsed)
+    return merged
 
 def unfold_ics_lines(ics_text):
-    lines = []
+    return list(_iter_unfolded_lines(ics_text))
+
+
+def _iter_unfolded_lines(ics_text):
+    """Yield logical (unfolded) ICS lines lazily so callers can stop early.
+
+    Continuation segments are collected and joined once, keeping long folded
+    values linear instead of quadratic.
+    """
+    parts = []
     for line in ics_text.splitlines():
-        if line.startswith(" ") or line.startswith("\t"):
-            if lines:
-                lines[-1] += line[1:]
+        if line[:1] in (" ", "\t"):
+            if parts:
+                parts.append(line[1:])
         else:
-            lines.append(line)
-    return lines
+            if parts:
+                yield parts[0] if len(parts) == 1 else "".join(parts)
+            parts = [line]
+    if parts:
+        yield parts[0] if len(parts) == 1 else "".join(parts)
 
 
-def parse_ics_simple(ics_text):
-    """Very basic ICS parser for common fields. Supports folded lines."""
-    data = {}
-    current_vevent = False
-    for line in unfold_ics_lines(ics_text):
-        if line == "BEGIN:VEVENT":
-            current_vevent = True
-            continue
-        if line == "END:VEVENT":
-            current_vevent = False
-            continue
+def _iter_ics_properties(pattern, ics_text):
+    """Yield unfolded property lines matched by one of the ICS_*_RE patterns."""
+    for match in pattern.finditer(ics_text):
+        yield ICS_UNFOLD_RE.sub("", match.group())
 
-        if current_vevent and ":" in line:
-            key_part, val = line.split(":", 1)
-            key = key_part.split(";")[0]
-            data[key] = unescape_ical_text(val)
-    return data
 
+def parse_ics_event(ics_text, lines=None):
+    """Parse the first VEVENT in a single pass. Supports folded lines.
 
-def parse_ics_event(ics_text):
-    parsed = parse_ics_simple(ics_text)
-    lines = unfold_ics_lines(ics_text)
+    Properties of nested components (e.g. VALARM) are ignored. Pass ``lines``
+    (from unfold_ics_lines) when the caller has already unfolded the text.
+    """
+    props = {}
     start_raw = None
     end_raw = None
     start_is_all_day = False
     end_is_all_day = False
 
     in_event = False
-    for line in lines:
-        if line == "BEGIN:VEVENT":
-            in_event = True
+    depth = 0
+    for line in (lines if lines is not None else _iter_unfolded_lines(ics_text)):
+        if not in_event:
+            if line == "BEGIN:VEVENT":
+                in_event = True
+            continue
+        if line[:6] == "BEGIN:":
+            depth += 1
             continue
-        if line == "END:VEVENT":
-            in_event = False
+        if line[:4] == "END:":
+            if not depth:
+                break
+            depth -= 1
             continue
-        if not in_event or ":" not in line:
+        if depth:
             continue
 
-        key_part, val = line.split(":", 1)
-        key_upper = key_part.upper()
-        if key_upper.startswith("DTSTART"):
+        key_part, sep, val = line.partition(":")
+        if not sep:
+            continue
+        name, _, params = key_part.partition(";")
+        # Property names are case-insensitive (RFC 5545); only DTSTART/DTEND
+        # were ever matched that way, other names are stored as written.
+        name_upper = name.upper()
+        if name_upper == "DTSTART":
             start_raw = val
-            if "VALUE=DATE" in key_upper:
-                start_is_all_day = True
-        elif key_upper.startswith("DTEND"):
+            start_is_all_day = bool(params) and "VALUE=DATE" in params.upper().split(";")
+        elif name_upper == "DTEND":
             end_raw = val
-            if "VALUE=DATE" in key_upper:
-                end_is_all_day = True
+            end_is_all_day = bool(params) and "VALUE=DATE" in params.upper().split(";")
+        else:
+            props[name] = val
 
-    start_val = start_raw if start_raw is not None else parsed.get("DTSTART")
-    end_val = end_raw if end_raw is not None else parsed.get("DTEND")
     is_all_day = start_is_all_day or end_is_all_day
 
     if is_all_day:
-        start_iso = caldav_date_to_iso(start_val)
-        end_iso = caldav_date_to_iso(end_val)
+        start_iso = caldav_date_to_iso(start_raw)
+        end_iso = caldav_date_to_iso(end_raw)
     else:
-        start_iso = caldav_to_iso(start_val)
-        end_iso = caldav_to_iso(end_val)
+        start_iso = caldav_to_iso(start_raw)
+        end_iso = caldav_to_iso(end_raw)
 
     return {
-        "uid": parsed.get("UID"),
-        "summary": parsed.get("SUMMARY"),
+        "uid": unescape_ical_text(props.get("UID")),
+        "summary": unescape_ical_text(props.get("SUMMARY")),
         "start": start_iso,
         "end": end_iso,
-        "location": parsed.get("LOCATION"),
-        "description": parsed.get("DESCRIPTION"),
-        "status": parsed.get("STATUS"),
+        "location": unescape_ical_text(props.get("LOCATION")),
+        "description": unescape_ical_text(props.get("DESCRIPTION")),
+        "status": unescape_ical_text(props.get("STATUS")),
         "all_day": is_all_day,
     }
 
 
+def _event_search_text(event):
+    """Summary, location and description casefolded once for substring queries."""
+    return "\x00".join((
+        event.get("summary") or "",
+        event.get("location") or "",
+        event.get("description") or "",
+    )).casefold()
+
+
 def caldav_date_to_iso(cal_str):
     if not cal_str:
         return None
-    clean = re.sub(r"[^0-9]", "", cal_str)
+    clean = NON_DIGIT_RE.sub("", cal_str)
     try:
+        if len(clean) == 8:
+            return _parse_caldav_date(clean).date().isoformat()
         dt = datetime.strptime(clean, "%Y%m%d")
         return dt.date().isoformat()
     except Exception:
@@ -448,10 +774,11 @@ def iso_to_caldav_date(date_str):
     if not date_str:
         raise ValueError("Date value is required for all-day events")
     value = date_str.strip()
-    if re.fullmatch(r"\d{8}", value):
+    if YYYYMMDD_RE.fullmatch(value):
         return value
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
-        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y%m%d")
+    if ISO_DATE_RE.fullmatch(value):
+        datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))  # validate
+        return value.replace("-", "")
 
     dt = parse_iso_datetime(value)
     if not dt:
@@ -460,14 +787,114 @@ def iso_to_caldav_date(date_str):
 
 
 def normalize_all_day_range(start_value, end_value):
-    start_date = datetime.strptime(iso_to_caldav_date(start_value), "%Y%m%d")
-    end_date = datetime.strptime(iso_to_caldav_date(end_value), "%Y%m%d")
+    start_date = _parse_caldav_date(iso_to_caldav_date(start_value))
+    end_date = _parse_caldav_date(iso_to_caldav_date(end_value))
 
     if end_date <= start_date:
         end_date = start_date + timedelta(days=1)
 
     return start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d")
 
+# --- Events Cache ---
+# list_events results are kept on disk per (calendar, time range) together with
+# the calendar's CTag. While the CTag is unchanged a cheap Depth:0 PROPFIND
+# replaces the full REPORT and ICS parse.
+
+def _events_cache_dir() -> Optional[Path]:
+    if os.environ.get("APPLECAL_NO_CACHE", "").strip() not in ("", "0"):
+        return None
+    override = os.environ.get("APPLECAL_CACHE_DIR", "").strip()
+    if override:
+        return Path(override).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+    return (Path(xdg).expanduser() if xdg else Path.home() / ".cache") / "applecal"
+
+
+def _calendar_cache_key(calendar_url: str) -> str:
+    return hashlib.sha256(calendar_url.encode("utf-8")).hexdigest()[:16]
+
+
+def _events_cache_path(cache_dir: Path, calendar_url: str, start: str, end: str) -> Path:
+    range_key = hashlib.sha256(f"{start}/{end}".encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{_calendar_cache_key(calendar_url)}-{range_key}.json"
+
+
+def _read_events_cache(path: Path, ctag: str):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("schema") != EVENTS_CACHE_SCHEMA
+        or cached.get("version") != __version__
+        or cached.get("ctag") != ctag
+        or not isinstance(cached.get("events"), list)
+    ):
+        return None
+    try:
+        os.utime(path)  # mtime doubles as last-use time for pruning
+    except OSError:
+        pass
+    return cached["events"]
+
+
+def _write_events_cache(path: Path, calendar_url: str, ctag: str, events) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Cached events hold calendar content: keep the file private to the user.
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({
+                "schema": EVENTS_CACHE_SCHEMA,
+                "version": __version__,
+                "calendar_url": calendar_url,
+                "ctag": ctag,
+                "events": events,
+            }, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Events cache write failed: %s", e)
+        _unlink_quietly(tmp)
+        return
+    _prune_events_cache(path.parent, calendar_url)
+
+
+def _prune_events_cache(cache_dir: Path, calendar_url: str) -> None:
+    """Delete expired entries, and all but the most recently used few for this calendar."""
+    now = time.time()
+    prefix = f"{_calendar_cache_key(calendar_url)}-"
+    own = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        if now - mtime > EVENTS_CACHE_MAX_AGE:
+            _unlink_quietly(path)
+        elif path.name.startswith(prefix):
+            own.append((mtime, path))
+    own.sort(key=operator.itemgetter(0), reverse=True)
+    for _, path in own[EVENTS_CACHE_MAX_PER_CALENDAR:]:
+        _unlink_quietly(path)
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _invalidate_events_cache(calendar_url: str) -> None:
+    cache_dir = _events_cache_dir()
+    if cache_dir is None or not cache_dir.is_dir():
+        return
+    for path in cache_dir.glob(f"{_calendar_cache_key(calendar_url)}-*.json"):
+        _unlink_quietly(path)
+
 # --- CalDAV Client Class ---
 
 class AppleCalClient:
@@ -478,58 +905,117 @@ class AppleCalClient:
             raise ValueError("Invalid Apple ID — must be a valid email address (e.g. your@icloud.com)")
         self.apple_id = apple_id
         self.password = get_keychain_password("caldav.icloud.com", apple_id)
-        self.session = requests.Session()
-        self.session.auth = HTTPBasicAuth(self.apple_id, self.password)
-        self.session.headers.update({"User-Agent": user_agent, "Content-Type": "application/xml"})
-
-        # Retry on transient network errors (prefer idempotent methods to avoid duplicate writes)
-        retry = Retry(
-            total=MAX_RETRIES,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD", "OPTIONS", "PROPFIND", "REPORT"],
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        headers = {"User-Agent": user_agent, "Content-Type": "application/xml"}
+        self._http2 = _USE_HTTP2
+        if self._http2:
+            import httpx
+
+            # No custom transport: httpx only honours HTTPS_PROXY/ALL_PROXY/NO_PROXY
+            # when it builds its own. Connect and status retries live in _httpx_request.
+            self.session = httpx.Client(
+                auth=(self.apple_id, self.password),
+                headers=headers,
+                timeout=DEFAULT_TIMEOUT,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_connections=HTTP_POOL_SIZE),
+            )
+            self._connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        else:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from requests.auth import HTTPBasicAuth
+            from urllib3.util.retry import Retry
+
+            self.session = requests.Session()
+            self.session.auth = HTTPBasicAuth(self.apple_id, self.password)
+            self.session.headers.update(headers)
+
+            # Retry on transient network errors (prefer idempotent methods to avoid duplicate writes)
+            retry = Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=list(RETRY_STATUS_CODES),
+                allowed_methods=list(RETRY_METHODS),
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
 
         self.principal_url = None
         self.home_url = None
         self.outbox_url = None
         self.user_addresses = []
-        self._discover()
+        self._calendars_cache = None
+        self._calendar_url_by_name = {}
+        self._calendars_lock = threading.Lock()
+        try:
+            self._discover()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Release pooled connections held by the HTTP session."""
+        self.session.close()
 
-    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Wrapper around session.request with default timeout."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method: str, url: str, stream: bool = False, **kwargs):
+        """Wrapper around session.request with default timeout.
+
+        Returns a requests.Response, or an httpx.Response when HTTP/2 is in use.
+        Pass stream=True for multistatus replies consumed by _iter_multistatus_responses.
+        """
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
         logger.debug("%s %s", method, url)
-        resp = self.session.request(method, url, **kwargs)
+        if self._http2:
+            resp = self._httpx_request(method, url, stream, **kwargs)
+        else:
+            resp = self.session.request(method, url, stream=stream, **kwargs)
         logger.debug("→ %s", resp.status_code)
         return resp
 
+    def _httpx_request(self, method, url, stream, data=None, **kwargs):
+        request = self.session.build_request(method, url, content=data, **kwargs)
+        # A failed connect never reached the server, so any method may retry it;
+        # retrying on a status code is limited to idempotent methods.
+        status_retries = MAX_RETRIES if method in RETRY_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                resp = self.session.send(request, stream=stream)
+            except self._connect_errors as e:
+                if attempt >= MAX_RETRIES:
+                    raise
+                logger.debug("→ %s, retrying", e)
+            else:
+                if resp.status_code not in RETRY_STATUS_CODES or attempt >= status_retries:
+                    return resp
+                resp.close()
+                logger.debug("→ %s, retrying", resp.status_code)
+            time.sleep(RETRY_BACKOFF * (2 ** attempt))
+            attempt += 1
+
     def _discover(self):
         # 1. Principal
         resp = self._request("PROPFIND", ICLOUD_WELL_KNOWN, headers={"Depth": "0"},
-                             data='<?xml version="1.0"?><d:propfind xmlns:d="DAV:"><d:prop><d:current-user-principal/></d:prop></d:propfind>')
+                             data=PRINCIPAL_PROPFIND)
         resp.raise_for_status()
         root = parse_xml(resp.text)
         href = get_href(root)
         if not href:
             raise RuntimeError("Discovery failed: missing current-user-principal href")
-        parsed = urlparse(resp.url)
+        parsed = urlparse(str(resp.url))
         server_root = f"{parsed.scheme}://{parsed.netloc}"
         self.principal_url = href if href.startswith("http") else urljoin(server_root, href)
 
         # 2. Calendar Home, Outbox, and User Addresses
-        body = '''<?xml version="1.0"?>
-<d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
-    <d:prop>
-        <c:calendar-home-set/>
-        <c:schedule-outbox-URL/>
-        <c:calendar-user-address-set/>
-    </d:prop>
-</d:propfind>'''
-        resp = self._request("PROPFIND", self.principal_url, headers={"Depth": "0"}, data=body)
+        resp = self._request("PROPFIND", self.principal_url, headers={"Depth": "0"}, data=HOME_PROPFIND)
         resp.raise_for_status()
         root = parse_xml(resp.text)
         
@@ -556,15 +1042,32 @@ class AppleCalClient:
                 self.user_addresses.append(href_el.text)
 
     def list_calendars(self):
-        body = '<?xml version="1.0"?><d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav"><d:prop><d:displayname/><c:supported-calendar-component-set/></d:prop></d:propfind>'
-        resp = self._request("PROPFIND", self.home_url, headers={"Depth": "1"}, data=body)
-        resp.raise_for_status()
-        root = parse_xml(resp.text)
+        """Return the calendars in the home set, fetched once per client."""
+        with self._calendars_lock:
+            if self._calendars_cache is None:
+                cals = self._fetch_calendars()
+                by_name = {}
+                for c in cals:
+                    if c["name"]:
+                        by_name.setdefault(c["name"].lower(), c["url"])
+                self._calendar_url_by_name = by_name
+                self._calendars_cache = cals
+        return [dict(c) for c in self._calendars_cache]
+
+    def invalidate_calendars(self):
+        """Drop the cached calendar list so the next lookup re-runs PROPFIND."""
+        with self._calendars_lock:
+            self._calendars_cache = None
+            self._calendar_url_by_name = {}
+
+    def _fetch_calendars(self):
+        resp = self._request("PROPFIND", self.home_url, headers={"Depth": "1"}, data=CALENDARS_PROPFIND, stream=True)
+        _raise_for_status(resp)
         parsed = urlparse(self.home_url)
         server_root = f"{parsed.scheme}://{parsed.netloc}"
         
         cals = []
-        for response in root.findall("{DAV:}response"):
+        for response in _iter_multistatus_responses(resp):
             href = get_href(response)
             name_el = response.find(".//{DAV:}displayname")
             comps = response.findall(".//{urn:ietf:params:xml:ns:caldav}comp")
@@ -577,50 +1080,65 @@ class AppleCalClient:
         return cals
 
     def get_calendar_url(self, name):
-        cals = self.list_calendars()
-        for c in cals:
-            if c["name"] and c["name"].lower() == name.lower():
-                return c["url"]
-        raise ValueError(f"Calendar '{name}' not found.")
+        if self._calendars_cache is None:
+            self.list_calendars()
+        url = self._calendar_url_by_name.get(name.lower())
+        if url is None:
+            raise ValueError(f"Calendar '{name}' not found.")
+        return url
+
+    def _get_ctag(self, calendar_url):
+        """Return the calendar's CTag (changes on every modification), or None."""
+        try:
+            resp = self._request("PROPFIND", calendar_url, headers={"Depth": "0"}, data=CTAG_PROPFIND)
+            if resp.status_code != 207:
+                return None
+            ctag_el = parse_xml(resp.text).find(".//{http://calendarserver.org/ns/}getctag")
+        except Exception as e:
+            logger.debug("CTag lookup failed: %s", e)
+            return None
+        if ctag_el is None or not ctag_el.text:
+            return None
+        return ctag_el.text.strip()
 
-    def list_events(self, calendar_url, start_iso, end_iso, query=None, max_items=None):
-        start = iso_to_caldav(start_iso)
-        end = iso_to_caldav(end_iso)
-
-        body = f'''<?xml version="1.0" encoding="utf-8" ?>
-<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
-    <d:prop>
-        <d:getetag />
-        <c:calendar-data />
-    </d:prop>
-    <c:filter>
-        <c:comp-filter name="VCALENDAR">
-            <c:comp-filter name="VEVENT">
-                <c:time-range start="{start}" end="{end}"/>
-            </c:comp-filter>
-        </c:comp-filter>
-    </c:filter>
-</c:calendar-query>'''
-        resp = self._request("REPORT", calendar_url, headers={"Depth": "1"}, data=body)
-        resp.raise_for_status()
-        root = parse_xml(resp.text)
+    def _fetch_events(self, calendar_url, start, end):
+        body = CALENDAR_QUERY_TIME_RANGE.format(start=start, end=end)
+        resp = self._request("REPORT", calendar_url, headers={"Depth": "1"}, data=body, stream=True)
+        _raise_for_status(resp)
 
         events = []
-        for response in root.findall("{DAV:}response"):
+        for response in _iter_multistatus_responses(resp):
             data_el = response.find(".//{urn:ietf:params:xml:ns:caldav}calendar-data")
             if data_el is not None and data_el.text:
                 ev = parse_ics_event(data_el.text)
                 ev["url"] = get_href(response)
                 events.append(ev)
+        return events
+
+    def _load_events(self, calendar_url, start, end, use_cache=True):
+        """Events in [start, end), served from the on-disk cache while the CTag matches."""
+        cache_dir = _events_cache_dir() if use_cache else None
+        ctag = self._get_ctag(calendar_url) if cache_dir is not None else None
+        if not ctag:
+            return self._fetch_events(calendar_url, start, end)
+
+        cache_path = _events_cache_path(cache_dir, calendar_url, start, end)
+        events = _read_events_cache(cache_path, ctag)
+        if events is not None:
+            logger.debug("Events cache hit for %s", calendar_url)
+            return events
+        events = self._fetch_events(calendar_url, start, end)
+        _write_events_cache(cache_path, calendar_url, ctag, events)
+        return events
+
+    def list_events(self, calendar_url, start_iso, end_iso, query=None, max_items=None, use_cache=True):
+        start = iso_to_caldav(start_iso)
+        end = iso_to_caldav(end_iso)
 
+        events = self._load_events(calendar_url, start, end, use_cache=use_cache)
         if query:
-            q = query.lower()
-            events = [
-                e for e in events
-                if q in (e.get("summary") or "").lower()
-                or q in (e.get("location") or "").lower()
-                or q in (e.get("description") or "").lower()
-            ]
+            q = query.casefold()
+            events = [e for e in events if q in _event_search_text(e)]
 
         events.sort(key=lambda e: (e.get("start") or "", e.get("uid") or ""))
         if max_items is not None:
@@ -630,22 +1148,32 @@ class AppleCalClient:
 
         return events
 
-    def list_events_multi(self, calendar_names, start_iso, end_iso, query=None, max_items=None):
+    def list_events_multi(self, calendar_names, start_iso, end_iso, query=None, max_items=None, use_cache=True):
         if not calendar_names:
             raise ValueError("At least one --calendar must be provided")
+        # Repeated --calendar flags would only fetch and report the same data twice.
+        calendar_names = unique_calendar_names(calendar_names)
 
-        combined_events = []
-        for cal_name in calendar_names:
+        per_calendar_max = max_items if len(calendar_names) == 1 else None
+
+        def _list_one(cal_name):
             try:
                 cal_url = self.get_calendar_url(cal_name)
-                per_calendar_max = max_items if len(calendar_names) == 1 else None
-                events = self.list_events(cal_url, start_iso, end_iso, query=query, max_items=per_calendar_max)
+                events = self.list_events(cal_url, start_iso, end_iso, query=query, max_items=per_calendar_max, use_cache=use_cache)
                 for e in events:
                     e["calendar"] = cal_name
-                combined_events.extend(events)
+                return events
             except Exception as e:
                 # Log error for specific calendar but continue
-                combined_events.append({"calendar": cal_name, "error": str(e)})
+                return [{"calendar": cal_name, "error": str(e)}]
+
+        # Each REPORT is network-bound, so fetch calendars concurrently.
+        # Results are gathered in input order to keep the output stable.
+        combined_events = []
+        workers = min(MAX_PARALLEL_REQUESTS, len(calendar_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for events in executor.map(_list_one, calendar_names):
+                combined_events.extend(events)
 
         combined_events.sort(key=lambda e: (e.get("start") or "", e.get("uid") or ""))
 
@@ -666,7 +1194,7 @@ class AppleCalClient:
         return ordered
 
     def _build_freebusy_payload(self, start, end, user_addr):
-        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        stamp = _dtstamp_now()
         vfb = [
             "BEGIN:VCALENDAR",
             "VERSION:2.0",
@@ -699,24 +1227,11 @@ class AppleCalClient:
             return {"url": event_url, "ics": resp.text, "etag": resp.headers.get("ETag")}
         
         # Fallback search
-        body = f'''<?xml version="1.0" encoding="utf-8" ?>
-<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
-    <d:prop><d:getetag /><c:calendar-data /></d:prop>
-    <c:filter>
-        <c:comp-filter name="VCALENDAR">
-            <c:comp-filter name="VEVENT">
-                <c:prop-filter name="UID">
-                    <c:text-match collation="i;octet">{uid}</c:text-match>
-                </c:prop-filter>
-            </c:comp-filter>
-        </c:comp-filter>
-    </c:filter>
-</c:calendar-query>'''
-        resp = self._request("REPORT", calendar_url, headers={"Depth": "1"}, data=body)
-        resp.raise_for_status()
-        root = parse_xml(resp.text)
-        response = root.find("{DAV:}response")
-        if response is not None:
+        # Same as xml.sax.saxutils.escape, which would pull in urllib.request/ssl at import time
+        body = CALENDAR_QUERY_UID.format(uid=uid.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
+        resp = self._request("REPORT", calendar_url, headers={"Depth": "1"}, data=body, stream=True)
+        _raise_for_status(resp)
+        for response in _iter_multistatus_responses(resp):
             data_el = response.find(".//{urn:ietf:params:xml:ns:caldav}calendar-data")
             etag_el = response.find(".//{DAV:}getetag")
             return {
@@ -744,15 +1259,10 @@ class AppleCalClient:
     def create_event(self, calendar_url, summary, start_iso, end_iso, location=None, description=None, all_day=False):
         uid = str(uuid.uuid4()).upper()
         start_line, end_line = self._build_dt_fields(start_iso, end_iso, all_day=all_day)
-        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
         ics = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            f"PRODID:{PRODID}",
-            "BEGIN:VEVENT",
             f"UID:{uid}",
-            f"DTSTAMP:{stamp}",
+            f"DTSTAMP:{_dtstamp_now()}",
             start_line,
             end_line,
             f"SUMMARY:{escape_ical_text(summary)}"
@@ -761,12 +1271,12 @@ class AppleCalClient:
             ics.append(f"LOCATION:{escape_ical_text(location)}")
         if description:
             ics.append(f"DESCRIPTION:{escape_ical_text(description)}")
-        ics.extend(["END:VEVENT", "END:VCALENDAR"])
-        
-        ics_text = build_ical_text(ics)
+
+        ics_text = "".join([ICS_HEADER, build_ical_text(ics), ICS_FOOTER])
         event_url = urljoin(calendar_url, f"{uid}.ics")
         resp = self._request("PUT", event_url, data=ics_text, headers={"Content-Type": "text/calendar; charset=utf-8"})
         resp.raise_for_status()
+        _invalidate_events_cache(calendar_url)
         return {"uid": uid, "url": event_url, "status": "created"}
 
     def update_event(
@@ -790,10 +1300,10 @@ class AppleCalClient:
             new_ics_text = ics_body
         else:
             ics_text = event["ics"]
-            parsed = parse_ics_simple(ics_text)
-            parsed_event = parse_ics_event(ics_text)
+            unfolded = unfold_ics_lines(ics_text)
+            parsed_event = parse_ics_event(ics_text, lines=unfolded)
 
-            new_summary = summary if summary is not None else parsed.get("SUMMARY", "")
+            new_summary = summary if summary is not None else (parsed_event.get("summary") or "")
             current_start = parsed_event.get("start")
             current_end = parsed_event.get("end")
             new_start_input = start_iso if start_iso is not None else current_start
@@ -803,15 +1313,15 @@ class AppleCalClient:
             if clear_description and description is not None:
                 raise ValueError("Use either --description or --clear-description, not both")
 
-            new_loc = None if clear_location else (location if location is not None else parsed.get("LOCATION"))
-            new_desc = None if clear_description else (description if description is not None else parsed.get("DESCRIPTION"))
+            new_loc = None if clear_location else (location if location is not None else parsed_event.get("location"))
+            new_desc = None if clear_description else (description if description is not None else parsed_event.get("description"))
             new_all_day = parsed_event.get("all_day", False) if all_day is None else all_day
 
             if not new_start_input or not new_end_input:
                 raise ValueError("Event start/end could not be determined for update")
 
             start_line, end_line = self._build_dt_fields(new_start_input, new_end_input, all_day=new_all_day)
-            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            stamp = _dtstamp_now()
 
             # Preserve VEVENT properties by patching only mutable fields.
             # This keeps RRULE/EXDATE/VALARM/ATTACH/CLASS/TRANSP/custom properties intact.
@@ -830,7 +1340,7 @@ class AppleCalClient:
                 if new_desc:
                     target_lines.append(f"DESCRIPTION:{escape_ical_text(new_desc)}")
 
-            for line in unfold_ics_lines(ics_text):
+            for line in unfolded:
                 if line == "BEGIN:VEVENT":
                     in_vevent = True
                     replaced_fields_inserted = False
@@ -861,6 +1371,7 @@ class AppleCalClient:
             
         resp = self._request("PUT", event["url"], data=new_ics_text, headers=headers)
         resp.raise_for_status()
+        _invalidate_events_cache(calendar_url)
         return {"uid": uid, "url": event["url"], "status": "updated"}
 
     def delete_event(self, calendar_url, uid):
@@ -872,6 +1383,7 @@ class AppleCalClient:
             
         resp = self._request("DELETE", event["url"], headers=headers)
         resp.raise_for_status()
+        _invalidate_events_cache(calendar_url)
         return {"uid": uid, "status": "deleted"}
 
     def freebusy(self, calendar_url, start_iso, end_iso):
@@ -905,10 +1417,7 @@ class AppleCalClient:
                     break
 
         # 2. Try CalDAV REPORT (free-busy-query)
-        body = f'''<?xml version="1.0" encoding="utf-8" ?>
-<c:free-busy-query xmlns:c="urn:ietf:params:xml:ns:caldav">
-    <c:time-range start="{start}" end="{end}"/>
-</c:free-busy-query>'''
+        body = FREE_BUSY_QUERY.format(start=start, end=end)
         
         try:
             report_url = calendar_url
@@ -936,19 +1445,31 @@ class AppleCalClient:
         try:
             events = self.list_events(calendar_url, start_iso, end_iso)
             busy = []
+            busy_append = busy.append
+            _fromiso = datetime.fromisoformat
             for e in events:
                 if e.get("status") == "CANCELLED":
                     continue
-                e_start = parse_iso_datetime(e["start"])
-                e_end = parse_iso_datetime(e["end"])
-                if e_start and e_end:
-                    clipped = clip_to_range(e_start, e_end, q_start, q_end)
-                    if clipped:
-                        busy.append({
-                            "start": clipped["start"],
-                            "end": clipped["end"],
-                            "summary": e.get("summary")
-                        })
+                # Event times come from caldav_to_iso/caldav_date_to_iso (UTC
+                # isoformat or a bare date), so fromisoformat reads them as-is.
+                try:
+                    e_start = _fromiso(e.get("start"))
+                    e_end = _fromiso(e.get("end"))
+                except (TypeError, ValueError):
+                    continue
+                if e_start.tzinfo is None:
+                    e_start = e_start.replace(tzinfo=timezone.utc)
+                if e_end.tzinfo is None:
+                    e_end = e_end.replace(tzinfo=timezone.utc)
+                # Clip to the query window
+                cs = e_start if e_start > q_start else q_start
+                ce = e_end if e_end < q_end else q_end
+                if cs < ce:
+                    busy_append({
+                        "start": cs.isoformat(),
+                        "end": ce.isoformat(),
+                        "summary": e.get("summary")
+                    })
             return {
                 "busy": busy, 
                 "method": "event_fallback", 
@@ -961,12 +1482,18 @@ class AppleCalClient:
     def freebusy_multi(self, calendar_names, start_iso, end_iso):
         if not calendar_names:
             raise ValueError("At least one --calendar must be provided")
+        calendar_names = unique_calendar_names(calendar_names)
+
+        # Resolve every name up front so an unknown calendar fails before any
+        # free/busy request goes out, then query the calendars concurrently.
+        cal_urls = [self.get_calendar_url(cal_name) for cal_name in calendar_names]
+        workers = min(MAX_PARALLEL_REQUESTS, len(cal_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda url: self.freebusy(url, start_iso, end_iso), cal_urls))
 
         combined_busy = []
         calendars = []
-        for cal_name in calendar_names:
-            cal_url = self.get_calendar_url(cal_name)
-            fb = self.freebusy(cal_url, start_iso, end_iso)
+        for cal_name, fb in zip(calendar_names, results):
             cal_entry = {
                 "calendar": cal_name,
                 "method": fb.get("method"),
@@ -983,48 +1510,41 @@ class AppleCalClient:
             for interval in fb.get("busy", []):
                 combined_busy.append({
                     "calendar": cal_name,
-                    "start": interval.get("start"),
-                    "end": interval.get("end"),
+                    "start": interval.get("start") or "",
+                    "end": interval.get("end") or "",
                     "summary": interval.get("summary")
                 })
 
-        combined_busy.sort(key=lambda b: ((b.get("start") or ""), (b.get("end") or ""), (b.get("calendar") or "")))
+        combined_busy.sort(key=operator.itemgetter("start", "end", "calendar"))
         return {
             "busy": combined_busy,
+            "merged_busy": _merge_intervals(combined_busy),
             "calendars": calendars,
             "method": "multi_calendar_aggregate"
         }
 
     def _parse_freebusy_ics(self, ics_text, method_name):
         busy = []
-        # Support folded lines
-        lines = []
-        for line in ics_text.splitlines():
-            if line.startswith(" ") or line.startswith("\t"):
-                if lines: lines[-1] += line[1:]
-            else:
-                lines.append(line)
-        
-        for line in lines:
-            if line.startswith("FREEBUSY"):
-                parts = line.split(":", 1)
-                if len(parts) > 1:
-                    fb_val = parts[1]
-                    # Handle multiple intervals separated by comma
-                    intervals = fb_val.split(",")
-                    for interval in intervals:
-                        times = interval.split("/")
-                        if len(times) == 2:
-                            busy.append({
-                                "start": caldav_to_iso(times[0]),
-                                "end": caldav_to_iso(times[1])
-                            })
+        for line in _iter_ics_properties(ICS_FREEBUSY_RE, ics_text):
+            parts = line.split(":", 1)
+            if len(parts) > 1:
+                for start, end in FB_INTERVAL_RE.findall(parts[1]):
+                    start_iso = caldav_to_iso(start)
+                    # A period may be start/duration; resolve it to an end time
+                    duration = parse_ical_duration(end)
+                    start_dt = parse_iso_datetime(start_iso) if duration is not None else None
+                    busy.append({
+                        "start": start_iso,
+                        "end": (start_dt + duration).isoformat() if start_dt else caldav_to_iso(end)
+                    })
         return {"busy": busy, "method": method_name}
 
     def attach_add(self, calendar_url, uid, file_path):
         event = self.get_event(calendar_url, uid)
         if not event: raise ValueError(f"Event {uid} not found.")
         
+        import mimetypes
+
         path = resolve_attachment_path(file_path)
         mime, _ = mimetypes.guess_type(str(path))
         mime = mime or "application/octet-stream"
@@ -1034,32 +1554,26 @@ class AppleCalClient:
             headers = {
                 "Content-Type": mime,
                 "Content-Disposition": build_content_disposition_filename(path.name),
+                "Content-Length": str(path.stat().st_size),
                 "Prefer": "return=representation"
             }
+            # Both backends stream a file object in fixed-size chunks, so the
+            # attachment is never read into memory as a whole.
             resp = self._request("POST", upload_url, data=f, headers=headers)
         
         resp.raise_for_status()
+        _invalidate_events_cache(calendar_url)
         attach_url = resp.headers.get("Location")
         
-        # Now re-fetch event to find the MANAGED-ID
-        event = self.get_event(calendar_url, uid)
-        ics_text = event["ics"]
-        
-        # Unfold lines
-        lines = []
-        current_line = ""
-        for line in ics_text.splitlines():
-            if line.startswith(" ") or line.startswith("\t"):
-                current_line += line[1:]
-            else:
-                if current_line: lines.append(current_line)
-                current_line = line
-        if current_line: lines.append(current_line)
-
+        # The MANAGED-ID is only in the updated event; re-fetch it unless the
+        # server already returned it for Prefer: return=representation.
+        ics_text = resp.text
+        if "BEGIN:VCALENDAR" not in ics_text:
+            ics_text = self.get_event(calendar_url, uid)["ics"]
         managed_id = ""
-        for line in lines:
-            if line.startswith("ATTACH") and attach_url in line:
-                match = re.search(r'MANAGED-ID=([^:;]+)', line)
+        for line in _iter_ics_properties(ICS_ATTACH_RE, ics_text):
+            if attach_url in line:
+                match = MANAGED_ID_RE.search(line)
                 if match:
                     managed_id = match.group(1)
                     break
@@ -1071,59 +1585,41 @@ class AppleCalClient:
         if not event: raise ValueError(f"Event {uid} not found.")
         
         # 1. Attempt removal via API
+        headers = {"Prefer": "return=representation"}
         remove_url = f"{event['url']}?action=attachment-remove&managed-id={managed_id}"
-        resp = self._request("POST", remove_url)
+        resp = self._request("POST", remove_url, headers=headers)
         if resp.status_code >= 400:
              remove_url = f"{event['url']}?managed-id={managed_id}"
-             resp = self._request("DELETE", remove_url)
+             resp = self._request("DELETE", remove_url, headers=headers)
              
         # 2. Robust Verification and Manual Cleanup
-        event = self.get_event(calendar_url, uid)
-        ics_text = event["ics"]
-        
-        lines = []
-        current_line = ""
-        attachment_found = False
-        
-        # Parse and filter lines
-        new_ics_lines = []
-        in_vevent = False
-        
-        raw_lines = ics_text.splitlines()
-        i = 0
-        while i < len(raw_lines):
-            line = raw_lines[i]
-            # Unfold
-            full_line = line
-            while i + 1 < len(raw_lines) and (raw_lines[i+1].startswith(" ") or raw_lines[i+1].startswith("\t")):
-                i += 1
-                full_line += raw_lines[i][1:]
-            
-            if full_line == "BEGIN:VEVENT": in_vevent = True
-            
-            if in_vevent and full_line.startswith("ATTACH") and f"MANAGED-ID={managed_id}" in full_line:
-                attachment_found = True
-            else:
-                new_ics_lines.append(full_line)
-            
-            if full_line == "END:VEVENT": in_vevent = False
-            i += 1
-
-        if attachment_found:
-            # If still found after API call, manually update event
-            new_ics = "\r\n".join(new_ics_lines)
+        ics_text = resp.text if resp.status_code < 400 else ""
+        if "BEGIN:VCALENDAR" not in ics_text:
+            ics_text = self.get_event(calendar_url, uid)["ics"]
+        needle = f"MANAGED-ID={managed_id}"
+
+        def _has_attachment(text):
+            return any(needle in line for line in _iter_ics_properties(ICS_ATTACH_RE, text))
+
+        if _has_attachment(ics_text):
+            # If still found after API call, drop the ATTACH line and update manually
+            lines = ICS_UNFOLD_RE.sub("", ics_text).splitlines()
+            new_ics = "\r\n".join(l for l in lines if not (l.startswith("ATTACH") and needle in l))
             self.update_event(calendar_url, uid, ics_body=new_ics)
             
             # Final verify
             event = self.get_event(calendar_url, uid)
-            if f"MANAGED-ID={managed_id}" in event["ics"]:
-                raise RuntimeError(json.dumps({"error": f"Failed to remove attachment {managed_id} after manual attempt", "uid": uid}))
+            if _has_attachment(event["ics"]):
+                raise _JSONError({"error": f"Failed to remove attachment {managed_id} after manual attempt", "uid": uid})
 
+        _invalidate_events_cache(calendar_url)
         return {"uid": uid, "managed_id": managed_id, "status": "removed"}
 
 # --- CLI Implementation ---
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the CLI argument parser once per process."""
     parser = JSONArgumentParser(
         description="Apple Calendar Pro CLI — manage iCloud calendars via CalDAV.",
         epilog="Example: python3 applecal.py --apple-id you@icloud.com events list --calendar Family --from 2026-03-01 --to 2026-03-07"
@@ -1150,8 +1646,9 @@ def main():
     # events list
     ev_list = ev_sub.add_parser("list")
     ev_list.add_argument("--calendar", action="append", required=True)
-    ev_list.add_argument("--from", dest="start", default=datetime.now(timezone.utc).isoformat())
-    ev_list.add_argument("--to", dest="end", default=(datetime.now(timezone.utc) + timedelta(days=7)).isoformat())
+    # Defaults depend on the current time, so they are filled in after parsing
+    ev_list.add_argument("--from", dest="start", default=None)
+    ev_list.add_argument("--to", dest="end", default=None)
     ev_list.add_argument("--query")
     ev_list.add_argument("--max", type=int, dest="max_items")
 
@@ -1211,13 +1708,26 @@ def main():
     at_rem.add_argument("--calendar", required=True)
     at_rem.add_argument("--uid", required=True)
     at_rem.add_argument("--managed-id", required=True)
+    return parser
+
 
+def main():
     try:
-        args = parser.parse_args()
+        args = _build_parser().parse_args()
     except Exception as e:
         _json_error(str(e))
         sys.exit(2)
 
+    if args.command == "events" and args.subcommand == "list":
+        # A window anchored at "now" is never requested again, so caching it
+        # would only add a CTag round-trip and a cache file nobody reads.
+        args.use_cache = args.start is not None and args.end is not None
+        now = datetime.now(timezone.utc)
+        if args.start is None:
+            args.start = now.isoformat()
+        if args.end is None:
+            args.end = (now + timedelta(days=7)).isoformat()
+
     # Configure logging
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
@@ -1232,6 +1742,7 @@ def main():
         _json_error("Missing --apple-id. Provide your iCloud account email, e.g. --apple-id you@icloud.com", indent=args.json_indent)
         sys.exit(1)
 
+    client = None
     try:
         apple_id = require_non_empty(args.apple_id, "apple-id")
         client = AppleCalClient(apple_id)
@@ -1295,7 +1806,10 @@ def main():
             
         elif args.command == "events":
             if args.subcommand == "list":
-                result = client.list_events_multi(args.calendar, args.start, args.end, query=args.query, max_items=args.max_items)
+                result = client.list_events_multi(
+                    args.calendar, args.start, args.end,
+                    query=args.query, max_items=args.max_items, use_cache=args.use_cache,
+                )
             else:
                 url = client.get_calendar_url(require_non_empty(args.calendar, "calendar"))
                 if args.subcommand == "create":
@@ -1333,16 +1847,14 @@ def main():
                 result = client.attach_remove(url, args.uid, args.managed_id)
 
         if result is not None:
-            print(json.dumps(result, indent=args.json_indent, sort_keys=True))
+            _emit_json(result, indent=args.json_indent)
 
     except Exception as e:
-        # Check if e is already JSON (from RuntimeError in attach_remove)
-        try:
-            err_data = json.loads(str(e))
-            print(json.dumps(err_data, sort_keys=True))
-        except json.JSONDecodeError:
-            print(json.dumps({"error": str(e)}, sort_keys=True))
+        _emit_json(e.payload if isinstance(e, _JSONError) else {"error": str(e)})
         sys.exit(1)
+    finally:
+        if client is not None:
+            client.close()
 
 if __name__ == "__main__":
     main()